@@ -3,15 +3,29 @@
 #####################################################################################################
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+import os
 import time
+import math
+import random
 import re
-import json
-from typing import List, Dict, Tuple, Any, Union
-from bs4 import BeautifulSoup
+import asyncio
+import gc
+import orjson
+import zstandard
+from typing import List, Dict, Tuple, Any, Union, Callable, Iterator
+import lxml.html
+import lxml.etree
+from lxml.cssselect import CSSSelector
 from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
+from itertools import chain
+from collections import deque
+from operator import itemgetter
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
 from ratelimit import limits, sleep_and_retry
+from tenacity import retry, stop_after_attempt, wait_random_exponential, retry_if_exception_type, retry_if_result
 from fake_useragent import UserAgent
 
 #####################################################################################################
@@ -19,82 +33,152 @@ from fake_useragent import UserAgent
 #####################################################################################################
 
 ua = UserAgent()
-HEADERS = {'User-Agent': ua.random}
+UA_POOL = [ua.random for _ in range(32)]
+HTTP_POOL_SIZE = 64
+# Apenas erros de conexão (a requisição não chegou ao servidor): leituras e status não são 
+# reenviados, para não escaparem do limite de requisições da API da Steam
+adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, 
+                      max_retries=Retry(total=3, read=0, status=0, other=0, respect_retry_after_header=False, 
+                                        backoff_factor=0.3))
+SESSION = requests.Session()
+SESSION.mount('http://', adapter)
+SESSION.mount('https://', adapter)
 EXCLUDED_KEYWORDS = ['demo', 'trial', 'playtest', 'beta', 'dlc', 'soundtrack', 'trailer', 'movie', 'server']
+EXCLUDED_KEYWORDS_REGEX = re.compile('|'.join(map(re.escape, EXCLUDED_KEYWORDS)), re.IGNORECASE)
 STEAM_APP_LIST_URL_1 = 'http://api.steampowered.com/ISteamApps/GetAppList/v0002/'
 STEAM_APP_LIST_URL_2 = 'http://api.steampowered.com/ISteamApps/GetAppList/v2/'
 STEAM_APP_DETAILS_URL = 'https://store.steampowered.com/api/appdetails'
-FILE_ALL_STEAM_DETAILS = './data/all_steam_details.json'
+FILE_ALL_STEAM_DETAILS = './data/all_steam_details.json.zst'
 FILE_ALL_GAMES = './data/all_games.json'
+FILE_PARTIAL_GAMES = './data/{}.partial.json'
+PARTIAL_MAX_AGE = 12 * 60 * 60 # segundos
+ZSTD_LEVEL = 6
+STEAM_DETAILS_MAX_AGE = 30 * 24 * 60 * 60 # segundos
+STEAM_DETAILS_REFRESH_LIMIT = 1000 # apps desatualizados por execução
+STEAM_RATE_CALLS = 195
+STEAM_RATE_PERIOD = 310 # segundos
+STEAM_PRICE_RETRY_ROUNDS = 3
+MAX_PAGE_WORKERS = 16
+MAX_PREFETCH_PAGES = 32
+STEAM_DETAILS_WORKERS = 8
+MAX_BROWSER_CONTEXTS = 8
+BLOCKED_RESOURCES = '**/*.{png,jpg,jpeg,gif,webp,svg,woff,woff2}'
+NON_DIGITS_REGEX = re.compile(r'\D')
+GOG_PRICES_REGEX = re.compile(r'(-?\d*\.?\d+%|R\$\d*\.\d*)')
+
+NUUVEM_GAME_SELECTOR = CSSSelector('[data-component="product-card"]')
+NUUVEM_CARD_SELECTOR = CSSSelector('[class="product-card--wrapper"]')
+NUUVEM_PRICE_SELECTOR = CSSSelector('[class="product-button__label"]')
+NUUVEM_DISCOUNT_SELECTOR = CSSSelector('[class="product-discount"]')
+NUUVEM_IMG_SELECTOR = CSSSelector('img')
+NUUVEM_PAGINATION_SELECTOR = CSSSelector('[class="pagination"] a')
+GOG_GAME_SELECTOR = CSSSelector('[class="product-tile product-tile--grid"]')
+GOG_TITLE_SELECTOR = CSSSelector('[selenium-id="productTitle"]')
+GOG_IMG_SELECTOR = CSSSelector('[type="image/jpeg"]')
+GOG_PRICE_SELECTOR = CSSSelector('[selenium-id="productPrice"]')
+GOG_PAGINATION_SELECTOR = CSSSelector('[selenium-id="paginationPage"]')
+GAMERSGATE_GAME_SELECTOR = CSSSelector('div[class="column catalog-item product--item"]')
+GAMERSGATE_TITLE_SELECTOR = CSSSelector('div.catalog-item--title a')
+GAMERSGATE_IMG_SELECTOR = CSSSelector('div.catalog-item--image img')
+GAMERSGATE_DISCOUNT_SELECTOR = CSSSelector('li[class="catalog-item--product-label-v2 product--label-discount"]')
+GAMERSGATE_PRICE_SELECTOR = CSSSelector('div.catalog-item--price span')
+GAMERSGATE_FULL_PRICE_SELECTOR = CSSSelector('div.catalog-item--full-price')
+GAMERSGATE_PAGINATION_SELECTOR = CSSSelector('div.catalog-paginator li:last-child')
 
 #####################################################################################################
 # ==================================== Definição das funções - 1 ====================================
 #####################################################################################################
 
-def check_app_name(app_name: str, excluded_keywords: List[str]) -> bool:
-    """Checar se o nome do app possui alguma keyword da lista "excluded_keywords". 
+def get_headers() -> Dict[str, str]:
+    """Obter os headers de uma requisição, com um User-Agent sorteado do "UA_POOL".
+
+    Returns:
+        Dict[str, str]: Dicionário com os headers.
+    """
+    return {'User-Agent': random.choice(UA_POOL)}
+
+
+def check_app_name(app_name: str) -> bool:
+    """Checar se o nome do app possui alguma keyword da lista "EXCLUDED_KEYWORDS" (busca única 
+    com a regex pré-compilada "EXCLUDED_KEYWORDS_REGEX"). 
 
     Args:
         app_name (str): String com o nome do app.
-        excluded_keywords (List[str]): Lista de strings com as "keywords".
 
     Returns:
         bool: Se tiver a keyword no nome, retorna "False". Se não tiver, retorna "True".
     """
-    return all(keyword not in app_name.lower() for keyword in excluded_keywords)
+    return EXCLUDED_KEYWORDS_REGEX.search(app_name) is None
 
 
-def remove_duplicates(data: List[Dict[Any, Any]]) -> List[Dict[Any, Any]]:
-    """Remover elementos duplicados de uma lista de dicionários.
+def remove_duplicates(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Remover apps duplicados (mesmo ID) de uma lista de dicionários, mantendo a primeira 
+    ocorrência e a ordem original.
 
     Args:
-        data (List[Dict[str, str]]): Lista de dicionários.
+        data (List[Dict[str, Any]]): Lista de dicionários com os apps.
 
     Returns:
-        List[Dict[str, str]]: Lista de dicionário sem elementos duplicados.
+        List[Dict[str, Any]]: Lista de dicionários sem apps duplicados.
     """
     
-    unique_keys = set()
-    unique_list = []
-
+    unique_apps = {}
     for d in data:
-        key = tuple(sorted(d.items()))
-        if key not in unique_keys:
-            unique_keys.add(key)
-            unique_list.append(d)
+        unique_apps.setdefault(d['appid'], d)
 
-    return unique_list
+    return list(unique_apps.values())
 
 
 def merge_and_remove_duplicates(list1: List[Dict[str, str]], 
-                                list2: List[Dict[str, str]]) -> List[Dict[str, str]]:
-    """Unir e remover duplicatas de duas listas de dicinários.
+                                list2: List[Dict[str, str]]) -> Dict[str, Dict[str, str]]:
+    """Unir e remover duplicatas (pelo ID) de duas listas de dicinários de apps.
 
     Args:
         list1 (List[Dict[str, str]]): Lista de dicionários 1.
         list2 (List[Dict[str, str]]): Lista de dicionários 2.
 
     Returns:
-        List[Dict[str, str]]: Lista de dicionários final, sem duplicatas.
+        Dict[str, Dict[str, str]]: Dicionário final com os apps, sem duplicatas, indexados pelo ID.
     """
     
-    unique_appids = set()
+    unique_apps = {}
+    for item in chain(list1, list2):
+        unique_apps.setdefault(item['appid'], item)
 
-    list1_without_duplicates = [
-        item for item in list1 if (item['appid'] not in unique_appids) and not unique_appids.add(item['appid'])
-    ]
+    return unique_apps
 
-    list2_without_duplicates = [
-        item for item in list2 if (item['appid'] not in unique_appids) and not unique_appids.add(item['appid'])
-    ]
 
-    final_list = list1_without_duplicates + list2_without_duplicates
+def parse_price(text: str) -> float:
+    """Converter uma string de preço/porcentagem (ex.: "R$ 1.234,56", "-25%") em float, 
+    considerando apenas os dígitos (centavos).
 
-    return final_list
+    Args:
+        text (str): String com o preço ou a porcentagem.
+
+    Returns:
+        float: Valor numérico dividido por 100. Caso a string não tenha dígitos, lança ValueError.
+    """
+    return float(NON_DIGITS_REGEX.sub('', text)) / 100
+
+
+def select_first(selector: CSSSelector, element: Any) -> Any:
+    """Obter o primeiro elemento HTML que corresponde a um seletor CSS.
+
+    Args:
+        selector (CSSSelector): Seletor CSS pré-compilado.
+        element (Any): Elemento HTML (lxml) onde a busca é realizada.
+
+    Returns:
+        Any: Primeiro elemento encontrado. Caso não exista, retorna None.
+    """
+    
+    matches = selector(element)
+    
+    return matches[0] if matches else None
 
 
 def read_json(file_path: str) -> Any:
-    """Ler um arquivo json.
+    """Ler um arquivo json (descomprimido com zstd, caso a extensão seja ".zst").
 
     Args:
         file_path (str): String com o caminho do arquivo.
@@ -102,23 +186,83 @@ def read_json(file_path: str) -> Any:
     Returns:
         Any: Conteúdo do arquivo json.
     """
-    with open(file_path, 'r') as file:
-        return json.load(file)
+    with open(file_path, 'rb') as file:
+        content = file.read()
+    if file_path.endswith('.zst'):
+        content = zstandard.ZstdDecompressor().decompress(content)
+    return orjson.loads(content)
  
     
 def write_json(data: Any, file_path: str) -> None:
-    """Escrever em um arquivo json.
+    """Escrever em um arquivo json (comprimido com zstd, caso a extensão seja ".zst").
 
     Args:
-        data (Any): Conteúdo a ser escrito no arquivo.
+        data (Any): Conteúdo a ser escrito no arquivo (de forma atômica, via arquivo temporário).
         file_path (str): String com o caminho do arquivo.
         
     Returns:
         None
     """
     
-    with open(file_path, 'w') as file:
-        json.dump(data, file)
+    content = orjson.dumps(data)
+    if file_path.endswith('.zst'):
+        content = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(content)
+    tmp_file_path = f'{file_path}.tmp'
+    with open(tmp_file_path, 'wb') as file:
+        file.write(content)
+    os.replace(tmp_file_path, file_path)
+
+
+def load_partial_games(shop_name: str, games: List[Dict[str, Any]]) -> bool:
+    """Carregar os jogos de uma loja salvos por uma execução anterior interrompida, caso o 
+    arquivo parcial seja recente (até "PARTIAL_MAX_AGE" segundos).
+
+    Args:
+        shop_name (str): String com o nome da loja.
+        games (List[Dict[str, Any]]): Lista global de jogos da loja.
+
+    Returns:
+        bool: Se os jogos forem carregados, retorna "True". Caso contrário, retorna "False".
+    """
+    
+    file_path = FILE_PARTIAL_GAMES.format(shop_name)
+    if (not os.path.exists(file_path)) or (time.time() - os.path.getmtime(file_path) > PARTIAL_MAX_AGE):
+        return False
+    games.extend(read_json(file_path))
+    print(f'\n{len(games)} jogos recuperados de uma execução anterior;')
+    
+    return True
+
+
+def save_partial_games(shop_name: str, games: List[Dict[str, Any]]) -> None:
+    """Salvar os jogos de uma loja em um arquivo parcial, para que não precisem ser obtidos 
+    novamente caso a execução seja interrompida.
+
+    Args:
+        shop_name (str): String com o nome da loja.
+        games (List[Dict[str, Any]]): Lista global de jogos da loja.
+
+    Returns:
+        None
+    """
+    
+    write_json(games, FILE_PARTIAL_GAMES.format(shop_name))
+
+
+def remove_partial_games(shop_names: List[str]) -> None:
+    """Remover os arquivos parciais das lojas.
+
+    Args:
+        shop_names (List[str]): Lista de strings com os nomes das lojas.
+
+    Returns:
+        None
+    """
+    
+    for shop_name in shop_names:
+        file_path = FILE_PARTIAL_GAMES.format(shop_name)
+        if os.path.exists(file_path):
+            os.remove(file_path)
 
 #####################################################################################################
 # ======================================== Variáveis globais ========================================
@@ -128,30 +272,33 @@ games_steam = []
 games_nuuvem = []
 games_gamersgate = []
 games_gog = []
-all_details_steam = read_json(FILE_ALL_STEAM_DETAILS)
+all_details_steam = []
 
 #####################################################################################################
 # ==================================== Definição das funções - 2 ====================================
 #####################################################################################################
 
+@retry(wait=wait_random_exponential(min=1, max=60), stop=stop_after_attempt(6), 
+       retry=(retry_if_exception_type(requests.exceptions.RequestException) | retry_if_result(lambda r: r is None)),
+       retry_error_callback=lambda retry_state: None)
 @sleep_and_retry
-@limits(calls=195, period=310)
+@limits(calls=STEAM_RATE_CALLS, period=STEAM_RATE_PERIOD)
 def get_steam_response(url: str) -> Union[Dict, None]:
-    """Obter o response da API da Steam.
+    """Obter o response da API da Steam, tentando novamente (com espera exponencial aleatória) em 
+    caso de falha na requisição ou status_code diferente de 200.
 
     Args:
         url (str): String com a URL da API.
 
     Returns:
         Union[Dict, None]: Retorna um dicionário (json) caso o status_code da requisição
-        seja 200. Caso contrário, retorna None.
+        seja 200. Caso todas as tentativas falhem, retorna None.
     """
-    with requests.Session() as session:
-        response = session.get(url, timeout=20, headers=HEADERS)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            return None
+    response = SESSION.get(url, timeout=20, headers=get_headers())
+    if response.status_code == 200:
+        return orjson.loads(response.content)
+    else:
+        return None
 
 
 def get_steam_apps(url: str) -> List[Dict[str, str]]:
@@ -171,120 +318,107 @@ def get_steam_apps(url: str) -> List[Dict[str, str]]:
     return [
         {'appid': str(app['appid']), 'name': app['name']}
         for app in app_list_data['applist']['apps']
-        if (app.get('name')) and (check_app_name(app['name'], EXCLUDED_KEYWORDS))
+        if (app.get('name')) and (check_app_name(app['name']))
     ]
 
 
-def get_steam_prices(apps: List[Dict[str, str]], appsids: List[str], slice_1: int, 
-                     slice_2: int) -> List[Dict[str, Union[str, float]]]:
-    """Obter os preços dos apps da Steam.
+def get_steam_prices(apps_dict: Dict[str, Dict[str, str]], 
+                     appsids_batch: List[str]) -> Union[List[Dict[str, Union[str, float]]], None]:
+    """Obter os preços de um lote de apps da Steam (uma única requisição).
 
     Args:
-        apps (List[Dict[str, str]]): Lista de dicionários com os apps.
-        appsids (List[str]): Lista com os IDs dos apps.
-        slice_1 (int): Defina o elemento inicial da fatia de IDs.
-        slice_2 (int):  Defina o elemento final da fatia de IDs.
+        apps_dict (Dict[str, Dict[str, str]]): Dicionário com os apps, indexados pelo ID.
+        appsids_batch (List[str]): Lista com os IDs dos apps do lote.
 
     Returns:
-        List[Dict[str, Union[str, float]]]: Lista de dicionários com as informações (id,
-        nome, url, preços) dos apps da Steam.
+        Union[List[Dict[str, Union[str, float]]], None]: Lista de dicionários com as informações 
+        (id, nome, url, preços) dos apps da Steam. Caso todas as tentativas da requisição falhem, 
+        retorna None.
     """
     
-    values_as_string = ','.join(map(str, appsids[slice_1:slice_2]))
-    apps_details = None
-    while apps_details is None:
-        apps_details = get_steam_response(f'{STEAM_APP_DETAILS_URL}?appids={values_as_string}&cc=BR&filters=price_overview')
+    values_as_string = ','.join(appsids_batch)
+    apps_details = get_steam_response(f'{STEAM_APP_DETAILS_URL}?appids={values_as_string}&cc=BR&filters=price_overview')
+    if apps_details is None:
+        return None
     apps_slice = []
-    apps_dict = {app['appid']: app for app in apps}
     for key, value in apps_details.items():
-        if key in apps_dict:
-            app = apps_dict[key]
-            appid = app['appid']
-            name = app['name']  
-        if value and value['success'] and value['data'] and value['data'] is not None:
-            try:     
-                final_price = float(value['data']['price_overview']['final']) / 100       
-                discount = float(value['data']['price_overview']['discount_percent']) / 100
-                initial_price = float(value['data']['price_overview']['initial']) / 100
-            except ValueError:
-                final_price = 0.0
-                discount = 0.0
-                initial_price = 0.0
-        
-            apps_slice.append(
-                {
-                    'appid': appid,
-                    'name': name,
-                    'href': f'https://store.steampowered.com/app/{appid}',
-                    'initial_price': initial_price,
-                    'final_price': final_price,
-                    'discount': discount,
-                }
-            )
+        app = apps_dict.get(key)
+        if (app is None) or not (value and value['success'] and value['data']):
+            continue
+        price_overview = value['data'].get('price_overview')
+        if not price_overview:
+            continue
+        appid = app['appid']
+        apps_slice.append(
+            {
+                'appid': appid,
+                'name': app['name'],
+                'href': f'https://store.steampowered.com/app/{appid}',
+                'initial_price': price_overview['initial'] / 100,
+                'final_price': price_overview['final'] / 100,
+                'discount': price_overview['discount_percent'] / 100,
+            }
+        )
     
     return apps_slice
 
 
-def process_slice_steam(apps: List[Dict[str, str]], appsids: List[str], slice_1: int, 
-                     slice_2: int, lock: Lock) -> None:
-    """Unir a lista de preços dos apps da fatia atual com a lista global de jogos da Steam.
-
-    Args:
-        apps (List[Dict[str, str]]): Lista de dicionários com os apps.
-        appsids (List[str]): Lista com os IDs dos apps.
-        slice_1 (int): Defina o elemento inicial da fatia de IDs.
-        slice_2 (int):  Defina o elemento final da fatia de IDs.
-        lock (Lock): Auxiliar para evitar problemas com Threads.
-    
-    Returns:
-        None
-    """
-    
-    global games_steam
-   
-    apps_prices_slice = get_steam_prices(apps, appsids, slice_1, slice_2)
-    with lock:
-        games_steam.extend(apps_prices_slice)
-    print(f'{len(games_steam)} jogos processados')
-
-
-def execute_steam_threadpool(loops: int, slice_data: int, apps: List[Dict[str, str]], 
-                             appsids: List[str], last_slice: int, lock: Lock) -> None:
-    """Executar as funções da Steam com ThreadPoolExecutor.
+def execute_steam_threadpool(apps_dict: Dict[str, Dict[str, str]], 
+                             batches: List[List[str]]) -> List[List[str]]:
+    """Executar as funções da Steam com ThreadPoolExecutor. Cada lote retorna a sua lista de 
+    preços, que é unida à lista global de jogos da Steam apenas na thread principal. Os lotes 
+    que falharem são requisitados novamente (até "STEAM_PRICE_RETRY_ROUNDS" vezes), sempre após 
+    esperar uma janela inteira do limite de requisições da API.
 
     Args:
-        loops (int): Quantidade de loops (requisições).
-        slice_data (int): Quantidade apps por fatia.
-        apps (List[Dict[str, str]]): Lista de dicionários com os apps.
-        appsids (List[str]): Lista com os IDs dos apps.
-        last_slice (int): Quantidade de apps para a última fatia, caso seja necesário.
-        lock (Lock): Auxiliar para evitar problemas com Threads.
+        apps_dict (Dict[str, Dict[str, str]]): Dicionário com os apps, indexados pelo ID.
+        batches (List[List[str]]): Lista de lotes (listas) de IDs dos apps, um por requisição.
         
     Returns:
-        None
+        List[List[str]]: Lista com os lotes que falharam em todas as tentativas (vazia, caso 
+        todos os preços tenham sido obtidos).
     """
     
     global games_steam
     
-    with ThreadPoolExecutor() as executor:
-        futures = []
-        for i in range(loops):
-            slice_1 = i * slice_data
-            slice_2 = slice_1 + slice_data
-            future = executor.submit(process_slice_steam, apps, appsids, slice_1, slice_2, lock)
-            futures.append(future)
-
-        if last_slice > 0:
-            slice_2 = slice_1 + last_slice
-            process_slice_steam(apps, appsids, slice_1, slice_2, lock)
+    apps_prices = []
+    pending_batches = batches
+    for retry_round in range(STEAM_PRICE_RETRY_ROUNDS + 1):
+        if retry_round:
+            print(f'\n{len(pending_batches)} lote(s) da Steam falharam; nova tentativa em {STEAM_RATE_PERIOD} segundos...\n')
+            time.sleep(STEAM_RATE_PERIOD)
+        
+        failed_batches = []
+        # Uma thread por conexão do pool: as requisições em andamento nunca esperam por conexão livre
+        with ThreadPoolExecutor(max_workers=HTTP_POOL_SIZE) as executor:
+            futures = {executor.submit(get_steam_prices, apps_dict, batch): batch for batch in pending_batches}
+            
+            for future in as_completed(futures):
+                batch_prices = future.result()
+                if batch_prices is None:
+                    failed_batches.append(futures[future])
+                    continue
+                apps_prices.extend(batch_prices)
+                print(f'{len(apps_prices)} jogos processados')
         
-        for future in as_completed(futures):
-            future.result()
+        pending_batches = failed_batches
+        if not pending_batches:
+            break
+    
+    for batch in pending_batches:
+        print(f'Lote da Steam não obtido ({len(batch)} apps, de {batch[0]} a {batch[-1]})')
+    
+    games_steam.extend(apps_prices)
+    
+    return pending_batches
     
 
 def get_new_appsids_steam(games_steam: List[Dict[str, str]], 
                           all_details_steam: List[Dict[str, str]]) -> List[str]:
-    """Obter os IDs dos apps novos da Steam que ainda não foram obtidos os detalhes. 
+    """Obter os IDs dos apps novos da Steam que ainda não foram obtidos os detalhes. Os apps 
+    cujos detalhes foram salvos como indisponíveis (falha da API) são obtidos novamente, assim 
+    como os detalhes obtidos há mais de "STEAM_DETAILS_MAX_AGE" segundos (os mais antigos 
+    primeiro, até "STEAM_DETAILS_REFRESH_LIMIT" por execução).
 
     Args:
         games_steam (List[Dict[str, str]]): Lista de dicionários com os apps da execução atual 
@@ -292,16 +426,22 @@ def get_new_appsids_steam(games_steam: List[Dict[str, str]],
         all_details_steam (List[Dict[str, str]]): Lista de dicionários com detalhes dos apps.
 
     Returns:
-        List[str]: Lista de strings com os IDs dos apps novos.
+        List[str]: Lista de strings com os IDs dos apps novos ou desatualizados.
     """
     
-    appsids_set = set(game['appid'] for game in games_steam)
-    appsids = list(appsids_set)
-
-    appsids_to_remove = {details['appid'] for details in all_details_steam if details['appid'] in appsids_set}
-    appsids = [appid for appid in appsids if appid not in appsids_to_remove]
+    get_appid = itemgetter('appid')
+    current_appsids = set(map(get_appid, games_steam))
+    available_details = [details for details in all_details_steam if details['type'] != 'Indisponível']
+    new_appsids = current_appsids - set(map(get_appid, available_details))
     
-    return appsids
+    # Detalhes salvos antes do controle de validade não possuem "updated_at" (tratados como os mais antigos)
+    stale_before = time.time() - STEAM_DETAILS_MAX_AGE
+    stale_details = [details for details in available_details 
+                     if details['appid'] in current_appsids and details.get('updated_at', 0) < stale_before]
+    stale_details.sort(key=lambda details: details.get('updated_at', 0))
+    stale_appsids = list(dict.fromkeys(map(get_appid, stale_details)))[:STEAM_DETAILS_REFRESH_LIMIT]
+    
+    return list(new_appsids) + stale_appsids
 
 
 def data_unavailable_steam(appid: str) -> Dict[str, str]:
@@ -360,49 +500,52 @@ def get_steam_app_details(app_details: Dict[str, Any], appid: str) -> Dict[str,
     return app_details_formated
 
 
-def append_all_details_steam(appid: str, appsids: List[str]) -> None:
-    """Adiciona os detalhes novos na lista global "all_details_steam".
+def get_steam_details(appid: str) -> Dict[str, str]:
+    """Obter, via API da Steam, os detalhes de um app novo (com o horário em que foram obtidos).
 
     Args:
         appid (str): String com o ID do app.
-        appsids (List[str]): Lista de strings com os IDs dos apps.
 
     Returns:
-        None
+        Dict[str, str]: Dicionário filtrado com os detalhes necessários do app.
     """
-        
-    global all_details_steam
     
     try:
-        app_details = get_steam_response(f'{STEAM_APP_DETAILS_URL}?appids={appid}&cc=BR&l=pt')
-    except requests.exceptions.JSONDecodeError:
-        all_details_steam.append(data_unavailable_steam(appid))
-        return None
-    except requests.exceptions.ReadTimeout:
-        time.sleep(310)
-        try:
-            app_details = get_steam_response(f'{STEAM_APP_DETAILS_URL}?appids={appid}&cc=BR&l=pt')
-        except requests.exceptions.JSONDecodeError:
-            all_details_steam.append(data_unavailable_steam(appid))
-            return None
+        response = get_steam_response(f'{STEAM_APP_DETAILS_URL}?appids={appid}&cc=BR&l=pt')
+    except orjson.JSONDecodeError:
+        response = None
+    app_details = response.get(appid) if response else None
+    
+    return {**get_steam_app_details(app_details, appid), 'updated_at': int(time.time())}
 
-    while app_details is None:
-        try:
-            app_details = get_steam_response(f'{STEAM_APP_DETAILS_URL}?appids={appid}&cc=BR&l=pt')
-            if app_details is not None:
-                break
-        except:
-            continue
 
-    app_details = app_details[appid]
+def execute_details_steam_threadpool(appsids: List[str]) -> None:
+    """Adicionar os detalhes dos apps novos na lista global "all_details_steam", obtidos 
+    concorrentemente com ThreadPoolExecutor (o limite de requisições da API continua sendo 
+    respeitado por "get_steam_response"). Os detalhes são unidos por ID: um app aparece uma 
+    única vez na lista, e detalhes válidos já salvos não são substituídos por detalhes indisponíveis 
+    (falha da API).
+
+    Args:
+        appsids (List[str]): Lista de strings com os IDs dos apps novos ou desatualizados.
+
+    Returns:
+        None
+    """
     
-    all_details_steam.append(get_steam_app_details(app_details, appid))
+    global all_details_steam
     
-    if len(all_details_steam) == len(appsids):
-        print(f'{len(appsids)} jogos novos salvos da Steam;\n')
-        
-    if len(all_details_steam) == len(appsids):
-        print(f'{len(appsids)} jogos novos salvos da Steam;\n')
+    with ThreadPoolExecutor(max_workers=STEAM_DETAILS_WORKERS) as executor:
+        fetched_details = list(executor.map(get_steam_details, appsids))
+    
+    details_by_id = {}
+    for details in chain(all_details_steam, fetched_details):
+        old_details = details_by_id.get(details['appid'])
+        if old_details is not None and details['type'] == 'Indisponível' and old_details['type'] != 'Indisponível':
+            continue
+        details_by_id[details['appid']] = details
+    
+    all_details_steam[:] = details_by_id.values()
 
 
 def get_all_games_steam(games_steam: List[Dict[str, Union[str, float]]], 
@@ -420,71 +563,216 @@ def get_all_games_steam(games_steam: List[Dict[str, Union[str, float]]],
         gêneros, descrição, URL, preços) dos jogos.
     """
     
-    appsids_new = {game['appid'] for game in games_steam}
-
-    aux_details_dict = {game['appid']: game for game in all_details_steam 
-                        if game['appid'] in appsids_new}
-    aux_details = [game for game in aux_details_dict.values()]
-
-    aux_details_ordered = sorted(aux_details, key=lambda x: x['appid'])
-    games_steam_ordered = sorted(games_steam, key=lambda x: x['appid'])
+    details_by_id = {details['appid']: details for details in all_details_steam}
 
     return [
         {
             'id': game['appid'],
             'name': game['name'],
-            'img': aux_details_ordered[i]['img'],
-            'genres': aux_details_ordered[i]['genres'],
-            'description': aux_details_ordered[i]['description'],
+            'img': details['img'],
+            'genres': details['genres'],
+            'description': details['description'],
             'href': game['href'],
             'initial_price': game['initial_price'],
             'discount': game['discount'],
             'final_price': game['final_price'],
         }
-        for i, game in enumerate(games_steam_ordered)
-        if aux_details_ordered[i]['type'] == 'game'
+        for game in games_steam
+        if (details := details_by_id.get(game['appid'])) and details['type'] == 'game'
     ]
 
 
-def get_last_page_nuuvem(page: Any, initial_page_url: str) -> int:
-    """Obter a última página de jogos da Nuuvem.
+def get_page_content(page_url: str) -> bytes:
+    """Obter o conteúdo (HTML do servidor, sem renderização via JS) de uma página.
+
+    Args:
+        page_url (str): String com a URL da página.
+
+    Returns:
+        bytes: Conteúdo da página (vazio, caso o status_code da requisição indique erro).
+    """
+    
+    response = SESSION.get(page_url, timeout=20, headers=get_headers())
+    
+    return response.content if response.ok else b''
+
+
+def parse_html(content: bytes) -> Union[Any, None]:
+    """Obter a árvore HTML (lxml) do conteúdo de uma página.
+
+    Args:
+        content (bytes): Conteúdo da página.
+
+    Returns:
+        Union[Any, None]: Árvore HTML (lxml) da página. Caso o conteúdo esteja vazio ou não 
+        possa ser interpretado, retorna None.
+    """
+    
+    if not content.strip():
+        return None
+    try:
+        return lxml.html.fromstring(content)
+    except lxml.etree.ParserError:
+        return None
+
+
+def get_html_trees(page_urls: List[str]) -> Iterator[Tuple[int, str, Any]]:
+    """Obter as árvores HTML (lxml) de várias páginas. As páginas são baixadas concorrentemente 
+    (ThreadPoolExecutor) enquanto as já baixadas são processadas, na ordem, por quem consome o gerador.
+    No máximo "MAX_PREFETCH_PAGES" páginas ficam baixadas (ou em download) à espera do consumidor.
+
+    Args:
+        page_urls (List[str]): Lista de strings com as URLs das páginas.
+
+    Yields:
+        Iterator[Tuple[int, str, Any]]: Tuplas com o número, a URL e a árvore HTML (lxml) 
+        de cada página (None, caso a página venha vazia ou com erro).
+    """
+    
+    with ThreadPoolExecutor(max_workers=MAX_PAGE_WORKERS) as executor:
+        pending = deque()
+        for page_number, page_url in enumerate(page_urls, start=1):
+            pending.append((page_number, page_url, executor.submit(get_page_content, page_url)))
+            if len(pending) >= MAX_PREFETCH_PAGES:
+                page_number, page_url, future = pending.popleft()
+                yield page_number, page_url, parse_html(future.result())
+        
+        while pending:
+            page_number, page_url, future = pending.popleft()
+            yield page_number, page_url, parse_html(future.result())
+
+
+def get_rendered_tree(page_url: str) -> Any:
+    """Obter a árvore HTML de uma página renderizada (via JS) com o Playwright. O navegador só é 
+    iniciado quando o HTML do servidor não possui os elementos esperados.
+
+    Args:
+        page_url (str): String com a URL da página.
+
+    Returns:
+        Any: Árvore HTML (lxml) da página renderizada.
+    """
+    
+    with sync_playwright() as p:
+        browser = p.firefox.launch(headless=True)
+        page = browser.new_page(user_agent=random.choice(UA_POOL))
+        page.goto(page_url)
+        tree = lxml.html.fromstring(page.content())
+        browser.close()
+    
+    return tree
+
+
+async def render_pages(js_pages: List[Tuple[int, str]], get_games: Callable[[Any], Any], 
+                       games: List[Dict[str, Union[str, float]]]) -> List[int]:
+    """Renderizar (via JS) páginas de uma loja com o Playwright assíncrono e obter as informações 
+    de cada jogo. Até "MAX_BROWSER_CONTEXTS" páginas são renderizadas ao mesmo tempo, cada uma em 
+    seu próprio contexto do navegador, e imagens/fontes são bloqueadas.
+
+    Args:
+        js_pages (List[Tuple[int, str]]): Lista de tuplas com o número e a URL de cada página.
+        get_games (Callable[[Any], Any]): Função que obtém os jogos de uma árvore HTML da loja.
+        games (List[Dict[str, Union[str, float]]]): Lista global de jogos da loja.
+
+    Returns:
+        List[int]: Lista com os números das páginas que, mesmo renderizadas, não possuem os 
+        elementos esperados.
+    """
+    
+    async with async_playwright() as p:
+        browser = await p.firefox.launch(headless=True)
+        semaphore = asyncio.Semaphore(MAX_BROWSER_CONTEXTS)
+        
+        async def render_page(page_number: int, page_url: str) -> Any:
+            async with semaphore:
+                context = await browser.new_context(user_agent=random.choice(UA_POOL))
+                await context.route(BLOCKED_RESOURCES, lambda route: route.abort())
+                page = await context.new_page()
+                await page.goto(page_url)
+                content = await page.content()
+                await context.close()
+            print(f'Página {page_number} processada (Playwright)')
+            return get_games(lxml.html.fromstring(content))
+        
+        pages_games = await asyncio.gather(*(render_page(page_number, page_url) 
+                                             for page_number, page_url in js_pages))
+        await browser.close()
+    
+    failed_pages = []
+    for (page_number, _), page_games in zip(js_pages, pages_games):
+        if page_games is None:
+            failed_pages.append(page_number)
+            continue
+        games.extend(page_games)
+    
+    return failed_pages
+
+
+def append_games_data(page_urls: List[str], get_games: Callable[[Any], Any], 
+                      games: List[Dict[str, Union[str, float]]]) -> List[int]:
+    """Obter as informações de cada jogo de todas as páginas de uma loja. As páginas são 
+    baixadas concorrentemente via HTTP; o Playwright só é iniciado se alguma página não possuir 
+    os elementos esperados no HTML.
+
+    Args:
+        page_urls (List[str]): Lista de strings com as URLs das páginas.
+        get_games (Callable[[Any], Any]): Função que obtém os jogos de uma árvore HTML da loja.
+        games (List[Dict[str, Union[str, float]]]): Lista global de jogos da loja.
+        
+    Returns:
+        List[int]: Lista com os números das páginas das quais não foi possível obter os jogos.
+    """
+    
+    js_pages = []
+    for page_number, page_url, tree in get_html_trees(page_urls):
+        page_games = get_games(tree) if tree is not None else None
+        if page_games is None:
+            js_pages.append((page_number, page_url))
+            continue
+        games.extend(page_games)
+        print(f'Página {page_number} processada')
+
+    if not js_pages:
+        return []
+    
+    return asyncio.run(render_pages(js_pages, get_games, games))
+
+
+def get_last_page_nuuvem(initial_page_url: str) -> int:
+    """Obter a última página de jogos da Nuuvem (via HTTP, com o Playwright como alternativa 
+    caso a paginação não esteja no HTML do servidor).
 
     Args:
-        page (Any): Página do chromium para interações.
-        page_url (str): String com a URL da página inicial.
+        initial_page_url (str): String com a URL da página inicial.
 
     Returns:
         int: Número da última página de jogos.
     """
 
-    page.goto(initial_page_url)
-    last_page = int(page.query_selector('[class="pagination"]').query_selector_all('a')[-2].text_content())
+    tree = parse_html(get_page_content(initial_page_url))
+    pagination = NUUVEM_PAGINATION_SELECTOR(tree) if tree is not None else []
+    if not pagination:
+        pagination = NUUVEM_PAGINATION_SELECTOR(get_rendered_tree(initial_page_url))
+    last_page = int(pagination[-2].text_content())
     
     return last_page
 
 
-def process_prices_nuuvem(game_card: Any) -> Tuple[float]:
+def process_prices_nuuvem(discount: Union[str, None], final_price: str) -> Tuple[float]:
     """Processar e tratar os preços de um jogo da Nuuvem.
 
     Args:
-        game_card (Any): Elemento HTML que representa um jogo especiífico.
+        discount (Union[str, None]): String com a porcentagem de desconto do jogo (None, caso 
+        não tenha desconto).
+        final_price (str): String com o preço final do jogo.
 
     Returns:
         Tuple[float]: Tupla de floats com o preço inicial, a porcentagem de desconto e 
         o preço final do jogo.
     """
+    discount = parse_price(discount) if discount else 0.0
     try:
-        discount = game_card.query_selector('[class="product-discount"]').text_content()
-        discount = float(''.join(re.findall(r'\d', discount))) / 100
-    except AttributeError:
-        discount = 0.0
-    try:   
-        final_price = game_card.query_selector('[class="product-button__label"]').text_content()
-    except:
-        # indisponível
-        return None       
-    try:
-        final_price = float(''.join(re.findall(r'\d', final_price))) / 100
+        final_price = parse_price(final_price)
         initial_price = round(final_price / (1.0 - discount), 2)
     except ValueError:
         final_price = 0.0
@@ -494,7 +782,8 @@ def process_prices_nuuvem(game_card: Any) -> Tuple[float]:
     
     
 def process_game_element_nuuvem(game: Any) -> Dict[str, Union[str, float]]:
-    """Processar um elemento HTML que representa um jogo da Nuuvem.
+    """Processar um elemento HTML que representa um jogo da Nuuvem. Cada elemento interno 
+    é buscado uma única vez.
 
     Args:
         game (Any): Elemento HTML que representa um jogo.
@@ -504,19 +793,23 @@ def process_game_element_nuuvem(game: Any) -> Dict[str, Union[str, float]]:
         imagem, gêneros, URL, preços) do jogo.
     """
     
-    game_id = game.get_attribute('data-track-product-sku') 
-    game_card = game.query_selector('[class="product-card--wrapper"]')
-    try:    
-        unavailable = game_card.query_selector('[class="product-button__label"]').text_content()
-    except:
+    game_id = game.get('data-track-product-sku') 
+    game_card = select_first(NUUVEM_CARD_SELECTOR, game)
+    if game_card is None:
+        return None
+    price_label = select_first(NUUVEM_PRICE_SELECTOR, game_card)
+    if price_label is None:
+        # indisponível
         return None 
-    name = game_card.get_attribute('title')
-    if not check_app_name(name, EXCLUDED_KEYWORDS):
+    name = game_card.get('title')
+    if not check_app_name(name):
         return None
-    href = game_card.get_attribute('href')
-    img = game_card.query_selector('img').get_attribute('src')
-    genres = [game.get_attribute('data-track-product-genre')]
-    initial_price, discount, final_price = process_prices_nuuvem(game_card)
+    href = game_card.get('href')
+    img = select_first(NUUVEM_IMG_SELECTOR, game_card).get('src')
+    genres = [game.get('data-track-product-genre')]
+    discount_label = select_first(NUUVEM_DISCOUNT_SELECTOR, game_card)
+    discount = discount_label.text_content() if discount_label is not None else None
+    initial_price, discount, final_price = process_prices_nuuvem(discount, price_label.text_content())
     
     return {
         'id': game_id,
@@ -528,140 +821,161 @@ def process_game_element_nuuvem(game: Any) -> Dict[str, Union[str, float]]:
         'discount': discount,
         'final_price': final_price,
     }
+
+
+def get_games_nuuvem(tree: Any) -> Union[List[Dict[str, Union[str, float]]], None]:
+    """Obter as informações dos jogos de uma página da Nuuvem.
+
+    Args:
+        tree (Any): Árvore HTML (lxml) da página.
+
+    Returns:
+        Union[List[Dict[str, Union[str, float]]], None]: Lista de dicionários com as informações 
+        (id, nome, imagem, gêneros, URL, preços) dos jogos. Caso a página não possua os elementos
+        esperados (renderização via JS), retorna None.
+    """
+    
+    games = NUUVEM_GAME_SELECTOR(tree)
+    if not games:
+        return None
+    
+    page_games = []
+    for game in games:
+        game_data = process_game_element_nuuvem(game)
+        if game_data:
+            page_games.append(game_data)
+    
+    return page_games
  
     
-def append_games_data_nuuvem(page: Any, last_page: int) -> None:
+def append_games_data_nuuvem(last_page: int) -> List[int]:
     """Obter as informações de cada jogo de todas as páginas de jogos da Nuuvem.
 
     Args:
-        page (Any): Página do chromium para interações.
         last_page (int): Número da última página de jogos.
         
     Returns:
-        None
+        List[int]: Lista com os números das páginas das quais não foi possível obter os jogos.
     """
     
     global games_nuuvem
     
-    for page_number in range(1, last_page+1):
-        page_url = f'https://www.nuuvem.com/br-pt/catalog/platforms/pc/types/games/sort/title/sort-mode/asc/page/{page_number}'
-        page.goto(page_url)
-        games = page.query_selector_all('[data-component="product-card"]')
-        for game in games:
-            game_data = process_game_element_nuuvem(game)
-            if game_data:
-                games_nuuvem.append(game_data)
-        print(f'Página {page_number} processada')
+    page_urls = [f'https://www.nuuvem.com/br-pt/catalog/platforms/pc/types/games/sort/title/sort-mode/asc/page/{page_number}' for page_number in range(1, last_page+1)]
+    return append_games_data(page_urls, get_games_nuuvem, games_nuuvem)
 
 
-def scrape_page_gamersgate(page_url: str) -> List[Dict[str, Union[str, float]]]:
+def get_games_gamersgate(tree: Any) -> List[Dict[str, Union[str, float]]]:
     """Realizar a raspagem de informações dos jogos de uma página da Gamersgate.
 
     Args:
-        page_url (str): String com a URL da página.
+        tree (Any): Árvore HTML (lxml) da página.
 
     Returns:
         List[Dict[str, Union[str, float]]: Lista de dicionários com as informações (id, nome, 
         imagem, URL e preços) de um jogo.
     """
     
-    with requests.Session() as session:
-        page = session.get(page_url, timeout=20, headers=HEADERS)
-        pg = BeautifulSoup(page.content, 'html.parser')
-        games = pg.find_all('div', attrs={'class': 'column catalog-item product--item'})
-        page_games = []
-        for game in games:
-            game_id = game['data-id']
-            game_title = game.find('div', attrs={'class': 'catalog-item--title'}).find('a')
-            name = game_title['title']
-            if not check_app_name(name, EXCLUDED_KEYWORDS):
-                continue
-            href = 'https://gamersgate.com' + game_title['href']
-            img = game.find('div', attrs={'class': 'catalog-item--image'}).find('img')['src']
-            try:
-                discount = game.find('li', attrs={'class': 'catalog-item--product-label-v2 product--label-discount'}).text
-                discount = float(''.join(re.findall(r'\d', discount))) / 100
-            except AttributeError:
-                discount = 0.0
-            final_price = game.find('div', attrs={'class': 'catalog-item--price'}).find('span').text
-            try:
-                initial_price = game.find('div', attrs={'class': 'catalog-item--full-price'}).text
-            except AttributeError:
-                initial_price = final_price
-            try:
-                final_price = float(''.join(re.findall(r'\d', final_price))) / 100
-                initial_price = float(''.join(re.findall(r'\d', initial_price))) / 100
-            except:
-                final_price = 0.0
-                initial_price = 0.0
-            page_games.append(
-                {
-                    'id': game_id,
-                    'name': name,
-                    'img': img,
-                    'href': href,
-                    'initial_price': initial_price,
-                    'discount': discount,
-                    'final_price': final_price,
-                }
-            )
+    games = GAMERSGATE_GAME_SELECTOR(tree)
+    page_games = []
+    for game in games:
+        game_id = game.get('data-id')
+        game_title = select_first(GAMERSGATE_TITLE_SELECTOR, game)
+        name = game_title.get('title')
+        if not check_app_name(name):
+            continue
+        href = 'https://gamersgate.com' + game_title.get('href')
+        img = select_first(GAMERSGATE_IMG_SELECTOR, game).get('src')
+        try:
+            discount = select_first(GAMERSGATE_DISCOUNT_SELECTOR, game).text_content()
+            discount = parse_price(discount)
+        except AttributeError:
+            discount = 0.0
+        final_price = select_first(GAMERSGATE_PRICE_SELECTOR, game).text_content()
+        try:
+            initial_price = select_first(GAMERSGATE_FULL_PRICE_SELECTOR, game).text_content()
+        except AttributeError:
+            initial_price = final_price
+        try:
+            final_price = parse_price(final_price)
+            initial_price = parse_price(initial_price)
+        except:
+            final_price = 0.0
+            initial_price = 0.0
+        page_games.append(
+            {
+                'id': game_id,
+                'name': name,
+                'img': img,
+                'href': href,
+                'initial_price': initial_price,
+                'discount': discount,
+                'final_price': final_price,
+            }
+        )
     return page_games
 
 
-def process_page_gamersgate(page_number: int, page_url: str, lock: Lock) -> None:
-    """Unir a lista de preços dos jogos da página atual com a lista global de jogos da Gamersgate.
+def get_last_page_gamersgate(initial_page_url: str) -> int:
+    """Obter a última página de jogos da Gamersgate.
 
     Args:
-        page_number (int): Número da página atual.
-        page_url (str): String com a URL da página atual.
-        lock (Lock): Auxiliar para evitar problemas com Threads.
-    
+        initial_page_url (str): String com a URL da página inicial.
+
     Returns:
-        None
+        int: Número da última página de jogos.
     """
     
-    global games_gamersgate
+    tree = parse_html(get_page_content(initial_page_url))
+    if tree is None:
+        raise RuntimeError(f'Página inicial da Gamersgate vazia ou com erro: {initial_page_url}')
+    pagination = GAMERSGATE_PAGINATION_SELECTOR(tree)
+    last_page = int(pagination[-1].text_content())
     
-    page_games = scrape_page_gamersgate(page_url)
-    with lock:
-        games_gamersgate.extend(page_games)
-    print(f'Página {page_number} processada')
+    return last_page
 
 
-def execute_gamersgate_threadpool(last_page: int, lock: Lock) -> None:
-    """Executar as funções da Gamersgate com ThreadPoolExecutor.
+def execute_gamersgate_threadpool(last_page: int) -> List[int]:
+    """Executar as funções da Gamersgate com ThreadPoolExecutor (download das páginas). Páginas 
+    vazias ou com erro são ignoradas.
 
     Args:
         last_page (int): Número da última página de jogos.
-        lock (Lock): Auxiliar para evitar problemas com Threads.
     
     Returns:
-        None
+        List[int]: Lista com os números das páginas ignoradas.
     """
     
     global games_gamersgate
     
-    with ThreadPoolExecutor() as executor:
-        page_urls = [f'https://www.gamersgate.com/games/?platform=pc&platform=mac&platform=linux&dlc=on&page={page_number}&sort=alphabetically&per_page=90' for page_number in range(1, last_page+1)]
-        futures = [executor.submit(process_page_gamersgate, page_number, page_url, lock) for page_number, page_url in enumerate(page_urls, start=1)]
-
-        for future in as_completed(futures):
-            future.result()
+    skipped_pages = []
+    page_urls = [f'https://www.gamersgate.com/games/?platform=pc&platform=mac&platform=linux&dlc=on&page={page_number}&sort=alphabetically&per_page=90' for page_number in range(1, last_page+1)]
+    for page_number, _, tree in get_html_trees(page_urls):
+        if tree is None:
+            skipped_pages.append(page_number)
+            print(f'Página {page_number} ignorada (vazia ou com erro)')
+            continue
+        games_gamersgate.extend(get_games_gamersgate(tree))
+        print(f'Página {page_number} processada')
+    
+    return skipped_pages
 
 
-def get_last_page_gog(page: Any, initial_page_url: str) -> int:
-    """Obter a última página de jogos da Gog.
+def get_last_page_gog(initial_page_url: str) -> int:
+    """Obter a última página de jogos da Gog (via HTTP, com o Playwright como alternativa 
+    caso a paginação não esteja no HTML do servidor).
 
     Args:
-        page (Any): Página do chromium para interações.
-        page_url (str): String com a URL da página inicial.
+        initial_page_url (str): String com a URL da página inicial.
 
     Returns:
         int: Número da última página de jogos.
     """
     
-    page.goto(initial_page_url)
-    last_page = int(page.query_selector_all('[selenium-id="paginationPage"]')[-1].text_content())
+    tree = parse_html(get_page_content(initial_page_url))
+    pagination = GOG_PAGINATION_SELECTOR(tree) if tree is not None else []
+    if not pagination:
+        pagination = GOG_PAGINATION_SELECTOR(get_rendered_tree(initial_page_url))
+    last_page = int(pagination[-1].text_content())
     
     return last_page
  
@@ -679,13 +993,13 @@ def process_prices_gog(final_price: str) -> Tuple[float]:
     initial_price = final_price
     discount = 0.0            
     if (final_price != 0.0) and ('%' in final_price):
-        aux = re.findall(r'(-?\d*\.?\d+%|R\$\d*\.\d*)', final_price)
-        discount = float(''.join(re.findall(r'\d', aux[0]))) / 100
+        aux = GOG_PRICES_REGEX.findall(final_price)
+        discount = parse_price(aux[0])
         initial_price = aux[1]
         final_price = aux[2]                          
     if (final_price != 0.0) and (initial_price != 0.0):
-        initial_price = float(''.join(re.findall(r'\d', initial_price))) / 100
-        final_price = float(''.join(re.findall(r'\d', final_price))) / 100
+        initial_price = parse_price(initial_price)
+        final_price = parse_price(final_price)
     
     return (initial_price, discount, final_price)
     
@@ -701,16 +1015,17 @@ def process_game_element_gog(game: Any) -> Dict[str, Union[str, float]]:
         imagem, URL, preços) do jogo.
     """
     
-    game_id = game.get_attribute('data-product-id')           
-    name = game.query_selector('[selenium-id="productTitle"]').text_content().strip()
-    if not check_app_name(name, EXCLUDED_KEYWORDS):
+    game_id = game.get('data-product-id')           
+    name = select_first(GOG_TITLE_SELECTOR, game).text_content().strip()
+    if not check_app_name(name):
         return None            
+    image = GOG_IMG_SELECTOR(game)[0]
     try:
-        img = game.query_selector_all('[type="image/jpeg"]')[0].get_attribute('srcset').split(',')[0]
+        img = image.get('srcset').split(',')[0]
     except AttributeError:
-        img = game.query_selector_all('[type="image/jpeg"]')[0].get_attribute('lazyload').split(',')[0]           
-    href = game.get_attribute('href')           
-    final_price = game.query_selector('[selenium-id="productPrice"]').text_content()           
+        img = image.get('lazyload').split(',')[0]           
+    href = game.get('href')           
+    final_price = select_first(GOG_PRICE_SELECTOR, game).text_content()           
     if final_price == 'FREE':
         final_price = 0.0
     initial_price, discount, final_price = process_prices_gog(final_price)
@@ -724,31 +1039,70 @@ def process_game_element_gog(game: Any) -> Dict[str, Union[str, float]]:
         'discount': discount,
         'final_price': final_price,
     }
+
+
+def get_games_gog(tree: Any) -> Union[List[Dict[str, Union[str, float]]], None]:
+    """Obter as informações dos jogos de uma página da Gog.
+
+    Args:
+        tree (Any): Árvore HTML (lxml) da página.
+
+    Returns:
+        Union[List[Dict[str, Union[str, float]]], None]: Lista de dicionários com as informações 
+        (id, nome, imagem, URL, preços) dos jogos. Caso a página não possua os elementos
+        esperados (renderização via JS), retorna None.
+    """
+    
+    games = GOG_GAME_SELECTOR(tree)
+    if not games:
+        return None
+    
+    page_games = []
+    for game in games:
+        game_data = process_game_element_gog(game)
+        if game_data:
+            page_games.append(game_data)
+    
+    return page_games
  
     
-def append_games_data_gog(page: Any, last_page: int) -> None:
+def append_games_data_gog(last_page: int) -> List[int]:
     """Obter as informações de cada jogo de todas as páginas de jogos da Gog.
 
     Args:
-        page (Any): Página do chromium para interações.
         last_page (int): Número da última página de jogos.
         
     Returns:
-        List[Dict[str, Union[str, float]]]: Lista de dicionários com as informações (id, nome,
-        imagem, URL, preços) de cada jogo.
+        List[int]: Lista com os números das páginas das quais não foi possível obter os jogos.
     """
     
     global games_gog
     
-    for page_number in range(1, last_page+1):
-        page_url = f'https://www.gog.com/en/games?order=asc:title&hideDLCs=true&excludeReleaseStatuses=upcoming&page={page_number}'
-        page.goto(page_url)
-        games = page.query_selector_all('[class="product-tile product-tile--grid"]')
-        for game in games:
-            game_data = process_game_element_gog(game)
-            if game_data:
-                games_gog.append(game_data)
-        print(f'Página {page_number} processada')
+    page_urls = [f'https://www.gog.com/en/games?order=asc:title&hideDLCs=true&excludeReleaseStatuses=upcoming&page={page_number}' for page_number in range(1, last_page+1)]
+    return append_games_data(page_urls, get_games_gog, games_gog)
+
+
+def get_unavailable_shop_data(shop_name: str) -> Dict[str, Any]:
+    """Obter o dicionário de uma loja em que o jogo está indisponível.
+
+    Args:
+        shop_name (str): String com o nome da loja.
+
+    Returns:
+        Dict[str, Any]: Dicionário com as informações (loja, id, URL, preços) marcadas 
+        como indisponíveis.
+    """
+    
+    return {
+        "shop": shop_name,
+        "gameid": 'Indisponível',
+        "href": 'Indisponível',
+        "prices": {
+            "initial_price": 'Indisponível',
+            "discount": 'Indisponível',
+            "final_price": 'Indisponível'
+        }
+    }
 
 
 def add_missing_shops(all_games: Dict[str, Dict[str, Any]], 
@@ -771,22 +1125,34 @@ def add_missing_shops(all_games: Dict[str, Dict[str, Any]],
         missing_shops = set(shops.keys()) - existent_shops
 
         for missing_shop in missing_shops:
-            game_details['shops'].append(
-                {
-                    "shop": missing_shop,
-                    "gameid": 'Indisponível',
-                    "href": 'Indisponível',
-                    "prices": {
-                        "initial_price": 'Indisponível',
-                        "discount": 'Indisponível',
-                        "final_price": 'Indisponível'
-                    }
-                }
-            )  
+            game_details['shops'].append(get_unavailable_shop_data(missing_shop))
     
     return all_games 
 
 
+def get_shop_data(shop_name: str, game: Dict[str, Any]) -> Dict[str, Any]:
+    """Obter o dicionário com as informações de um jogo em uma loja.
+
+    Args:
+        shop_name (str): String com o nome da loja.
+        game (Dict[str, Any]): Dicionário com as informações (id, URL, preços) do jogo na loja.
+
+    Returns:
+        Dict[str, Any]: Dicionário com as informações (loja, id, URL, preços) do jogo na loja.
+    """
+    
+    return {
+        "shop": shop_name,
+        "gameid": game['id'],
+        "href": game['href'],
+        "prices": {
+            "initial_price": game['initial_price'],
+            "discount": game['discount'],
+            "final_price": game['final_price']
+        }
+    }
+
+
 def get_new_all_games(shops: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
     """Obter o novo dicionário de jogos.
 
@@ -796,46 +1162,29 @@ def get_new_all_games(shops: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, A
 
     Returns:
         Dict[str, Dict[str, Any]]: Dicionário com os jogos e suas informações (gêneros, 
-        descrição, imagem, lojas).
+        descrição, imagem, lojas), sem os jogos diferentes que possuem o mesmo nome.
     """
     
     all_games = {}
     for shop_name, games in shops.items():
         for game in games:
             game_name = game['name']
-            if game_name in all_games:
-                all_games[game_name]['shops'].append(
-                    {
-                        "shop": shop_name,
-                        "gameid": game['id'],
-                        "href": game['href'],
-                        "prices": {
-                            "initial_price": game['initial_price'],
-                            "discount": game['discount'],
-                            "final_price": game['final_price']
-                        }
-                    }
-                )
-            else:
-                all_games[game_name] = {
+            game_details = all_games.get(game_name)
+            if game_details is None:
+                game_details = all_games[game_name] = {
                     "genres": game.get('genres', ['Indisponível']),
                     "description": game.get('description', 'Sem descrição.'),
                     "img": game['img'],
-                    "shops": [
-                        {
-                            "shop": shop_name,
-                            "gameid": game['id'],
-                            "href": game['href'],
-                            "prices": {
-                                "initial_price": game['initial_price'],
-                                "discount": game['discount'],
-                                "final_price": game['final_price']
-                            }
-                        }
-                    ]
+                    "shops": []
                 }
+            game_details['shops'].append(get_shop_data(shop_name, game))
     
     all_games = add_missing_shops(all_games, shops)
+    
+    # Remove os jogos diferentes que possuem o mesmo nome (causa problema nas lojas)
+    max_shops = len(shops)
+    for game_name in [name for name, details in all_games.items() if len(details['shops']) > max_shops]:
+        del all_games[game_name]
                 
     return all_games
 
@@ -855,41 +1204,34 @@ def get_all_definitive_games(all_games: Dict[str, Dict[str, Any]],
         descrição, imagem, lojas) que será gravado no banco.
     """
     
-    all_games_definitive = all_games_old
+    # Internamente, as lojas de cada jogo ficam indexadas pelo nome (uma entrada por loja)
+    all_games_definitive = {}
+    all_games_definitive.update(
+        (game_name, {**game_info, "shops": {shop["shop"]: shop for shop in game_info["shops"]}}) 
+        for game_name, game_info in all_games_old.items()
+    )
     
-    for game_name, game_info_new in all_games.items():
-        if game_name in all_games_definitive:
-            for shop_new in game_info_new["shops"]:
-                shop_name_new = shop_new["shop"]
-                existing_shops = all_games_definitive[game_name]["shops"]
-
-                shop_index = next((index for index, shop in enumerate(existing_shops) if shop["shop"] == shop_name_new), None)
+    for game_name in all_games.keys() & all_games_definitive.keys():
+        existing_shops = all_games_definitive[game_name]["shops"]
+        for shop_new in all_games[game_name]["shops"]:
+            shop_name_new = shop_new["shop"]
+
+            if shop_name_new in existing_shops:
+                existing_shops[shop_name_new] = shop_new
+
+    for game_name in all_games_definitive.keys() - all_games.keys():
+        shops_old = all_games_definitive[game_name]["shops"]
+        for shop_name_old in shops_old:
+            shops_old[shop_name_old] = get_unavailable_shop_data(shop_name_old)
+    
+    # Volta ao formato de lista do banco, mantendo a ordem original das lojas
+    for game_info in all_games_definitive.values():
+        game_info["shops"] = list(game_info["shops"].values())
 
-                if shop_index is not None:
-                    existing_shops[shop_index] = shop_new
-        else:
-            all_games_definitive[game_name] = game_info_new
+    # Jogos novos são adicionados de uma vez, na ordem em que foram obtidos
+    all_games_definitive |= {game_name: game_info_new for game_name, game_info_new in all_games.items() 
+                             if game_name not in all_games_definitive}
 
-    for game_name, game_info_old in all_games_definitive.items():
-        if game_name not in all_games:
-            for shop_old in game_info_old["shops"]:
-                shop_name_old = shop_old["shop"]
-                existing_shops = game_info_old["shops"]
-                
-                shop_index = next((index for index, shop in enumerate(existing_shops) if shop["shop"] == shop_name_old), None)
-
-                if shop_index is not None:
-                    game_info_old["shops"][shop_index] = {
-                        "shop": shop_name_old,
-                        "gameid": 'Indisponível',
-                        "href": 'Indisponível',
-                        "prices": {
-                            "initial_price": 'Indisponível',
-                            "discount": 'Indisponível',
-                            "final_price": 'Indisponível'
-                        }
-                    }
-    
     return all_games_definitive
 
 
@@ -919,18 +1261,24 @@ def main():
 
     start = time.time()
 
-    apps_1 = get_steam_apps(STEAM_APP_LIST_URL_1)
-    apps_2 = get_steam_apps(STEAM_APP_LIST_URL_2)
-    
-    apps = merge_and_remove_duplicates(apps_1, apps_2)
-    
-    print(f"\n{len(apps)} recursos encontrados;\n")
-    appsids = list(map(lambda d: d['appid'], apps))
-    slice_data = len(appsids) // 190 # API Steam permite 200 requisições a cada 5 minutos
-    loops = len(appsids) // slice_data
-    last_slice = len(appsids) % slice_data
-    lock = Lock()
-    execute_steam_threadpool(loops, slice_data, apps, appsids, last_slice, lock)
+    if not load_partial_games('steam', games_steam):
+        apps_1 = get_steam_apps(STEAM_APP_LIST_URL_1)
+        apps_2 = get_steam_apps(STEAM_APP_LIST_URL_2)
+        
+        apps_dict = merge_and_remove_duplicates(apps_1, apps_2)
+        del apps_1, apps_2
+        
+        print(f"\n{len(apps_dict)} recursos encontrados;\n")
+        appsids = list(apps_dict)
+        batch_size = max(1, math.ceil(len(appsids) / 190)) # API Steam permite 200 requisições a cada 5 minutos
+        batches = [appsids[i:i+batch_size] for i in range(0, len(appsids), batch_size)]
+        failed_batches = execute_steam_threadpool(apps_dict, batches)
+        del apps_dict, appsids, batches
+        if failed_batches:
+            # Uma lista incompleta marcaria como indisponíveis os preços salvos dos jogos ausentes 
+            # (e não deve ser salva como resultado parcial)
+            raise RuntimeError(f'{len(failed_batches)} lote(s) de preços da Steam não foram obtidos; execução interrompida')
+        save_partial_games('steam', games_steam)
     
     end = time.time()
     total_time = end - start
@@ -945,13 +1293,14 @@ def main():
 
     start = time.time()
 
-    with sync_playwright() as p:
-        browser = p.firefox.launch(headless=True)
-        page = browser.new_page()
-        last_page = get_last_page_nuuvem(page, 'https://www.nuuvem.com/br-pt/catalog/platforms/pc/types/games/sort/title/sort-mode/asc')
+    if not load_partial_games('nuuvem', games_nuuvem):
+        last_page = get_last_page_nuuvem('https://www.nuuvem.com/br-pt/catalog/platforms/pc/types/games/sort/title/sort-mode/asc')
         print(f'\n{last_page} páginas encontradas;\n')
-        append_games_data_nuuvem(page, last_page)
-        browser.close() 
+        failed_pages = append_games_data_nuuvem(last_page)
+        if failed_pages:
+            # Assim como na Steam: os jogos das páginas ausentes teriam os preços salvos marcados como indisponíveis
+            raise RuntimeError(f'{len(failed_pages)} página(s) da Nuuvem sem jogos: {failed_pages}; execução interrompida')
+        save_partial_games('nuuvem', games_nuuvem)
             
     end = time.time()
     total_time = end - start
@@ -967,14 +1316,14 @@ def main():
 
     start = time.time()
 
-    url = 'https://www.gamersgate.com/games/?platform=pc&platform=mac&platform=linux&dlc=on&sort=alphabetically&per_page=90'
-    with requests.Session() as session:
-        gamersgate = session.get(url, timeout=20, headers=HEADERS)
-        initial_page = BeautifulSoup(gamersgate.content, 'html.parser')
-        last_page = int(initial_page.find('div', attrs={'class': 'catalog-paginator'}).find_all('li')[-1].text)
-    print(f'\n{last_page} páginas encontradas;\n')
-    lock = Lock()
-    execute_gamersgate_threadpool(last_page, lock)
+    if not load_partial_games('gamersgate', games_gamersgate):
+        last_page = get_last_page_gamersgate('https://www.gamersgate.com/games/?platform=pc&platform=mac&platform=linux&dlc=on&sort=alphabetically&per_page=90')
+        print(f'\n{last_page} páginas encontradas;\n')
+        failed_pages = execute_gamersgate_threadpool(last_page)
+        if failed_pages:
+            # Assim como na Steam: os jogos das páginas ausentes teriam os preços salvos marcados como indisponíveis
+            raise RuntimeError(f'{len(failed_pages)} página(s) da Gamersgate ignorada(s): {failed_pages}; execução interrompida')
+        save_partial_games('gamersgate', games_gamersgate)
     
     end = time.time()
     total_time = end - start
@@ -990,13 +1339,14 @@ def main():
 
     start = time.time()
 
-    with sync_playwright() as p:  
-        browser = p.firefox.launch(headless=True)  
-        page = browser.new_page() 
-        last_page = get_last_page_gog(page, 'https://www.gog.com/en/games?order=asc:title&hideDLCs=true&excludeReleaseStatuses=upcoming')
-        print(f'\n{last_page} páginas encontradas;\n')    
-        append_games_data_gog(page, last_page)                  
-        browser.close()
+    if not load_partial_games('gog', games_gog):
+        last_page = get_last_page_gog('https://www.gog.com/en/games?order=asc:title&hideDLCs=true&excludeReleaseStatuses=upcoming')
+        print(f'\n{last_page} páginas encontradas;\n')
+        failed_pages = append_games_data_gog(last_page)
+        if failed_pages:
+            # Assim como na Steam: os jogos das páginas ausentes teriam os preços salvos marcados como indisponíveis
+            raise RuntimeError(f'{len(failed_pages)} página(s) da GOG sem jogos: {failed_pages}; execução interrompida')
+        save_partial_games('gog', games_gog)
     
     end = time.time()
     total_time = end - start
@@ -1012,13 +1362,15 @@ def main():
 
     # ============================================== Steam ==============================================
 
+    all_details_steam = read_json(FILE_ALL_STEAM_DETAILS)
     appsids = get_new_appsids_steam(games_steam, all_details_steam)
-    print(f'\n{len(appsids)} recursos novos encontrados na Steam;\n')
+    print(f'\n{len(appsids)} recursos novos ou desatualizados encontrados na Steam;\n')
 
-    for appid in appsids: 
-        append_all_details_steam(appid, appsids)
-    
-    write_json(all_details_steam, FILE_ALL_STEAM_DETAILS)
+    if appsids:
+        execute_details_steam_threadpool(appsids)
+        print(f'{len(appsids)} recursos salvos da Steam;\n')
+        
+        write_json(all_details_steam, FILE_ALL_STEAM_DETAILS)
     
     games_steam = remove_duplicates(games_steam)
 
@@ -1034,16 +1386,19 @@ def main():
             'gog': games_gog}
 
     all_games = get_new_all_games(shops)
-
-    # Remove os jogos diferentes que possuem o mesmo nome (causa problema nas lojas)
-    all_games = {game: details for game, details in all_games.items() if len(details['shops']) <= len(shops)}
+    shop_names = list(shops)
+    del shops, all_games_steam
+    games_steam, games_nuuvem, games_gamersgate, games_gog, all_details_steam = [], [], [], [], []
 
     all_games_old = read_json(FILE_ALL_GAMES)
 
     all_games_definitive = get_all_definitive_games(all_games, all_games_old)
+    del all_games, all_games_old
+    gc.collect()
     print(f'{len(all_games_definitive)} jogos processados;\n')
 
     write_json(all_games_definitive, FILE_ALL_GAMES)
+    remove_partial_games(shop_names)
 
     print('#' * 91)        
     print('='*39 + ' FINALIZADO ' + '='*40)